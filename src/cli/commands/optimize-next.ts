@@ -2,20 +2,9 @@ import { readFileSync, writeFileSync, existsSync } from 'fs';
 import * as fs from 'fs/promises';
 import path from 'path';
 import { glob } from 'glob';
-import * as babel from '@babel/core';
-import { parse } from '@babel/parser';
-import _traverse from '@babel/traverse';
-import _generate from '@babel/generator';
 import * as t from '@babel/types';
-import { parseDocument } from 'htmlparser2';
-import { DomUtils } from 'htmlparser2';
-import { default as render } from 'dom-serializer';
-import { JSDOM } from 'jsdom';
 import chalk from 'chalk';
 
-const traverse = _traverse.default;
-const generate = _generate.default;
-
 /**
  * Fixes the critical "use client" + metadata export issue
  * by removing metadata from client component and suggesting proper placement
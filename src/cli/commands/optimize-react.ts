@@ -5,6 +5,7 @@ import { glob } from 'glob';
 import * as t from '@babel/types';
 import { execSync } from 'child_process';
 import chalk from 'chalk';
+import { mapWithConcurrency } from '../utils/concurrency.js';
 
 const helmetImportName = 'Helmet';
 
@@ -420,21 +421,26 @@ export async function optimizeReactComponents(projectRoot: string): Promise<void
     console.log(`Found ${files.length} React page files to optimize:`);
   }
    
-  let modifiedCount = 0;
-  for (const file of files) {
+  const pageFiles = files.filter(file => {
     if (!isLikelyPageFile(file)) {
       if (process.env.CLISEO_VERBOSE === 'true') console.log(`Skipping: ${path.relative(projectRoot, file)}`);
-      continue;
+      return false;
     }
+    return true;
+  });
 
+  // Each file is transformed independently, so overlap their reads and writes
+  const maxConcurrentFiles = 8;
+  const results = await mapWithConcurrency(pageFiles, maxConcurrentFiles, async (file) => {
     if (process.env.CLISEO_VERBOSE === 'true') console.log(`Processing: ${path.relative(projectRoot, file)}`);
     try {
-      const changed = await transformFile(file);
-      if (changed) modifiedCount++;
+      return await transformFile(file);
     } catch (error) {
       console.error(`Failed to transform ${file}: ${error}`);
+      return false;
     }
-  }
+  });
+  const modifiedCount = results.filter(Boolean).length;
 
   const summaryMsg = `React components optimized${modifiedCount ? `: modified ${modifiedCount} file(s)` : ' (no changes needed)'}`;
   console.log(summaryMsg);
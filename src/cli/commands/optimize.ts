@@ -7,17 +7,15 @@ import ora from 'ora';
 import { glob } from 'glob';
 import fs from 'fs';
 import path from 'path';
-import { optimizeReactComponents } from './optimize-react.js';
-import { optimizeVueComponents } from './optimize-vue.js';
-import { optimizeNextjsComponents } from './optimize-next.js';
 import inquirer from 'inquirer';
 import { execSync } from 'child_process';
 import axios from 'axios'; // Added for AI optimizations
+import { httpClient } from '../utils/http.js';
+import { mapWithConcurrency } from '../utils/concurrency.js';
+import { cacheKey, getCached, setCached } from '../utils/cache.js';
+import { memoizeByProjectRoot } from '../utils/detect-framework.js';
 import { fileURLToPath } from 'url';
 
-// JSX and TypeScript syntax support is handled by @babel/preset-react and @babel/preset-typescript
-import { text } from 'stream/consumers';
-
 // Get package.json for version info
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
@@ -243,11 +241,12 @@ function getFrameworkFileExtensions(framework: string): string[] {
  */
 async function getFilesToOptimize(projectRoot: string, framework: string): Promise<string[]> {
   const pagesDirectories = getPagesDirectory(projectRoot, framework);
-  const files: string[] = [];
+  // Set keeps discovery order while dropping files matched by more than one pattern
+  const files = new Set<string>();
 
   if (pagesDirectories.length === 0) {
     console.log(chalk.yellow(`⚠️  No pages directory found for ${framework}. Skipping file optimizations.`));
-    return files;
+    return [];
   }
 
 
@@ -262,116 +261,132 @@ async function getFilesToOptimize(projectRoot: string, framework: string): Promi
         absolute: true,
         ignore: ['**/node_modules/**']
       });
-      files.push(...foundFiles);
+      for (const file of foundFiles) {
+        files.add(file);
+      }
     }
   }
 
 
-  return files;
+  return [...files];
 }
 
 /**
- * Adds meta tags to HTML files in the pages directory.
+ * Adds missing title, viewport, description and lang tags and fixes H1 usage in a parsed HTML document.
+ * Returns true if the document was changed.
  */
-async function addMetaTagsToHtmlFiles(projectRoot: string, framework: string) {
-  const files = await getFilesToOptimize(projectRoot, framework);
+function addMetaTags($: cheerio.CheerioAPI): boolean {
+  let modified = false;
 
-  // Only process HTML files - framework-specific optimizers handle component files
-  const htmlFiles = files.filter(file => file.endsWith('.html'));
-
-  if (htmlFiles.length === 0) {
-    return;
+  // Add title if missing
+  if (!$('title').length) {
+    $('head').append('<title>Your Site Title</title>');
+    modified = true;
   }
 
-  console.log(chalk.cyan(`🔧 Adding meta tags to ${htmlFiles.length} HTML files...`));
-
-  for (const file of htmlFiles) {
-    const content = await fs.promises.readFile(file, 'utf-8');
-    const $ = cheerio.load(content);
+  // Add viewport meta if missing
+  if (!$('meta[name="viewport"]').length) {
+    $('head').append('<meta name="viewport" content="width=device-width, initial-scale=1.0">');
+    modified = true;
+  }
 
-    // Add title if missing
-    if (!$('title').length) {
-      $('head').append('<title>Your Site Title</title>');
-    }
+  // Add description meta if missing
+  if (!$('meta[name="description"]').length) {
+    $('head').append('<meta name="description" content="Your site description">');
+    modified = true;
+  }
 
-    // Add viewport meta if missing
-    if (!$('meta[name="viewport"]').length) {
-      $('head').append('<meta name="viewport" content="width=device-width, initial-scale=1.0">');
-    }
+  // Add language attribute to html element if missing
+  if (!$('html').attr('lang')) {
+    $('html').attr('lang', 'en');
+    modified = true;
+  }
 
-    // Add description meta if missing
-    if (!$('meta[name="description"]').length) {
-      $('head').append('<meta name="description" content="Your site description">');
+  // Fix H1 tag issues
+  const h1Elements = $('h1');
+  if (h1Elements.length === 0) {
+    // No H1 found - convert first H2 to H1, or add one if no headings exist
+    const firstH2 = $('h2').first();
+    if (firstH2.length) {
+      const h1Content = firstH2.html();
+      firstH2.replaceWith(`<h1>${h1Content}</h1>`);
+    } else {
+      // Add a placeholder H1 at the beginning of body
+      $('body').prepend('<h1>Page Title</h1>');
     }
+    modified = true;
+  } else if (h1Elements.length > 1) {
+    // Multiple H1s found - keep first one, convert others to H2
+    h1Elements.slice(1).each((_, element) => {
+      const h1Content = $(element).html();
+      $(element).replaceWith(`<h2>${h1Content}</h2>`);
+    });
+    modified = true;
+  }
 
-    // Add language attribute to html element if missing
-    if (!$('html').attr('lang')) {
-      $('html').attr('lang', 'en');
-    }
+  return modified;
+}
 
-    // Fix H1 tag issues
-    const h1Elements = $('h1');
-    if (h1Elements.length === 0) {
-      // No H1 found - convert first H2 to H1, or add one if no headings exist
-      const firstH2 = $('h2').first();
-      if (firstH2.length) {
-        const h1Content = firstH2.html();
-        firstH2.replaceWith(`<h1>${h1Content}</h1>`);
-      } else {
-        // Add a placeholder H1 at the beginning of body
-        $('body').prepend('<h1>Page Title</h1>');
-      }
-    } else if (h1Elements.length > 1) {
-      // Multiple H1s found - keep first one, convert others to H2
-      h1Elements.slice(1).each((_, element) => {
-        const h1Content = $(element).html();
-        $(element).replaceWith(`<h2>${h1Content}</h2>`);
-      });
+/**
+ * Adds alt attributes derived from the image file name to images in a parsed HTML document.
+ * Returns true if the document was changed.
+ */
+function addImagesAltAttributes($: cheerio.CheerioAPI): boolean {
+  let modified = false;
+
+  $('img').each((_, element) => {
+    if (!$(element).attr('alt')) {
+      const src = $(element).attr('src') || '';
+      const alt = path.basename(src, path.extname(src))
+        .replace(/[-_]/g, ' ')
+        .replace(/([A-Z])/g, ' $1')
+        .trim();
+      $(element).attr('alt', alt);
+      modified = true;
     }
+  });
 
-    await fs.promises.writeFile(file, $.html());
-  }
+  return modified;
 }
 
 /**
- * Adds alt attributes to images in files in the pages directory.
+ * Applies meta tag and image alt fixes to HTML files in the pages directory,
+ * parsing and writing each file only once.
  */
-async function addImagesAltAttributes(projectRoot: string, framework: string) {
+async function optimizeHtmlFiles(projectRoot: string, framework: string) {
   const files = await getFilesToOptimize(projectRoot, framework);
 
-  // Only process HTML files for image alt attributes
+  // Only process HTML files - framework-specific optimizers handle component files
   const htmlFiles = files.filter(file => file.endsWith('.html'));
 
   if (htmlFiles.length === 0) {
     return;
   }
 
-  console.log(chalk.cyan(`🖼️  Adding alt attributes to images in ${htmlFiles.length} HTML files...`));
+  console.log(chalk.cyan(`🔧 Adding meta tags and image alt attributes to ${htmlFiles.length} HTML files...`));
 
   for (const file of htmlFiles) {
     const content = await fs.promises.readFile(file, 'utf-8');
     const $ = cheerio.load(content);
 
-    $('img').each((_, element) => {
-      if (!$(element).attr('alt')) {
-        const src = $(element).attr('src') || '';
-        const alt = path.basename(src, path.extname(src))
-          .replace(/[-_]/g, ' ')
-          .replace(/([A-Z])/g, ' $1')
-          .trim();
-        $(element).attr('alt', alt);
-      }
-    });
+    const metaModified = addMetaTags($);
+    const altModified = addImagesAltAttributes($);
 
-    await fs.promises.writeFile(file, $.html());
+    // Leave untouched pages alone rather than re-serializing them
+    if (metaModified || altModified) {
+      await fs.promises.writeFile(file, $.html());
+    }
   }
 }
 
+// Framework is a property of the whole project, so each root is only scanned once per run
+const detectFramework = memoizeByProjectRoot(detectFrameworkUncached);
+
 /**
  * Scans all package.json files in the project for framework dependencies.
  * Returns the first framework found, or 'unknown' if none found.
  */
-async function detectFramework(projectRoot: string): Promise<'react' | 'vue' | 'next.js' | 'angular' | 'unknown'> {
+async function detectFrameworkUncached(projectRoot: string): Promise<'react' | 'vue' | 'next.js' | 'angular' | 'unknown'> {
   const packageJsonFiles = await glob('**/package.json', {
     cwd: projectRoot,
     ignore: [
@@ -698,8 +713,7 @@ export async function optimizeCommand(directory: string | undefined, options: {
 
     // Only process HTML files in the main function - framework-specific optimizers handle component files
     if (framework !== 'unknown') {
-      await addMetaTagsToHtmlFiles(dir, framework);
-      await addImagesAltAttributes(dir, framework);
+      await optimizeHtmlFiles(dir, framework);
     }
 
     spinner.stop();
@@ -711,6 +725,7 @@ export async function optimizeCommand(directory: string | undefined, options: {
     if (framework === 'react') {
       spinner.text = 'Optimizing React components...';
       try {
+        const { optimizeReactComponents } = await import('./optimize-react.js');
         await optimizeReactComponents(dir);
         spinner.stop();
       } catch (err) {
@@ -720,6 +735,7 @@ export async function optimizeCommand(directory: string | undefined, options: {
     } else if (framework === 'next.js') {
       spinner.text = 'Optimizing Next.js components...';
       try {
+        const { optimizeNextjsComponents } = await import('./optimize-next.js');
         await optimizeNextjsComponents(dir);
         spinner.stop();
       } catch (err) {
@@ -733,6 +749,7 @@ export async function optimizeCommand(directory: string | undefined, options: {
     else if (framework == 'vue') {
       spinner.text = 'Optimizing Vue components...';
       try {
+        const { optimizeVueComponents } = await import('./optimize-vue.js');
         await optimizeVueComponents(dir);
         spinner.stop();
       } catch (err) {
@@ -900,8 +917,9 @@ async function createAiSeoFiles(framework: string, projectRoot: string, aiData:
  */
 async function getAiAnalysis(projectDir: string): Promise<any> {
   try {
-    const { getAuthToken } = await import('../utils/config.js');
-    const token = await getAuthToken();
+    const { getAuthTokens } = await import('../utils/config.js');
+    const tokens = await getAuthTokens();
+    const token = tokens?.idToken;
 
     if (!token) {
       throw new Error('Authentication token not found');
@@ -915,23 +933,28 @@ async function getAiAnalysis(projectDir: string): Promise<any> {
     }
 
     // Send unified request to backend
-    const apiBase = process.env.API_URL || process.env.CLISEO_API_URL || 'https://a8iza6csua.execute-api.us-east-2.amazonaws.com';
-    if (!apiBase) {
-      throw new Error('Missing API base URL. Set API_URL or CLISEO_API_URL in your environment.');
-    }
-    
-    const response = await axios.post(`${apiBase}/ask-openai`, {
+    const payload = {
       readme: projectContext.readme,
       pages: projectContext.pages,
       components: projectContext.components,
       request_type: 'full_optimization'
-    }, {
+    };
+
+    // Re-running on an unchanged project reuses the previous analysis for the same account
+    const analysisCacheKey = cacheKey('full_optimization', tokens.email, payload);
+    const cachedAnalysis = await getCached<any>(analysisCacheKey);
+    if (cachedAnalysis) {
+      return cachedAnalysis;
+    }
+
+    const response = await httpClient.post('/ask-openai', payload, {
       headers: {
         'Authorization': `Bearer ${token}`,
         'Content-Type': 'application/json',
       },
     });
 
+    await setCached(analysisCacheKey, response.data);
     return response.data;
 
   } catch (error) {
@@ -957,6 +980,23 @@ async function performAiOptimizations(projectDir: string): Promise<void> {
   await applyAiOptimizationsToComponents(projectDir, aiData);
 }
 
+/**
+ * Reads only the beginning of a file, enough to hold `maxChars` characters plus one
+ * so callers can still tell whether the content needs truncating.
+ */
+async function readFileHead(filePath: string, maxChars: number): Promise<string> {
+  // A UTF-8 character is at most 4 bytes
+  const maxBytes = (maxChars + 1) * 4;
+  const handle = await fs.promises.open(filePath, 'r');
+  try {
+    const buffer = Buffer.alloc(maxBytes);
+    const { bytesRead } = await handle.read(buffer, 0, maxBytes, 0);
+    return buffer.toString('utf-8', 0, bytesRead);
+  } finally {
+    await handle.close();
+  }
+}
+
 /**
  * Gather website context for AI analysis
  */
@@ -977,7 +1017,7 @@ async function gatherComprehensiveContext(projectDir: string): Promise<{
     try {
       const readmePath = join(projectDir, readmeFile);
       if (existsSync(readmePath)) {
-        let readmeContent = await readFile(readmePath, 'utf-8');
+        let readmeContent = await readFileHead(readmePath, 2000);
         // Truncate README if too long
         if (readmeContent.length > 2000) {
           readmeContent = readmeContent.substring(0, 2000) + '...[truncated]';
@@ -1014,11 +1054,11 @@ async function gatherComprehensiveContext(projectDir: string): Promise<{
         }
 
         try {
-          let content = await readFile(file, 'utf-8');
+          const maxFileSize = 1000;
+          let content = await readFileHead(file, maxFileSize);
           const relativePath = path.relative(projectDir, file);
 
           // Truncate individual file content if needed
-          const maxFileSize = 1000;
           if (content.length > maxFileSize) {
             content = content.substring(0, maxFileSize) + '...[truncated]';
           }
@@ -1060,7 +1100,7 @@ async function gatherComprehensiveContext(projectDir: string): Promise<{
 
     for (const file of limitedComponents) {
       try {
-        let content = await readFile(file, 'utf-8');
+        let content = await readFileHead(file, 800);
         
         // Truncate large files
         if (content.length > 800) {
@@ -1083,94 +1123,6 @@ async function gatherComprehensiveContext(projectDir: string): Promise<{
 
 
 
-  return context;
-}
-
-// Legacy function kept for backward compatibility
-async function gatherWebsiteContext(projectDir: string): Promise<{ readme: string, pages: string[] }> {
-  const context = {
-    readme: '',
-    pages: [] as string[]
-  };
-
-  // Try to read README (with size limit)
-  const readmeFiles = ['README.md', 'readme.md', 'README.txt', 'readme.txt'];
-  for (const readmeFile of readmeFiles) {
-    try {
-      const readmePath = join(projectDir, readmeFile);
-      if (existsSync(readmePath)) {
-        let readmeContent = await readFile(readmePath, 'utf-8');
-        // Truncate README if too long (prioritize README with generous limit)
-        if (readmeContent.length > 2000) {
-          readmeContent = readmeContent.substring(0, 2000) + '...[truncated]';
-        }
-        context.readme = readmeContent;
-        break;
-      }
-    } catch (error) {
-      // Continue to next README file
-    }
-  }
-
-  // Gather page components (with size limits)
-  const framework = await detectFramework(projectDir);
-  const pageDirectories = getPagesDirectory(projectDir, framework);
-
-  const maxTotalPagesSize = 3000; // Remaining space after README
-  let currentPagesSize = 0;
-
-  for (const pagesDir of pageDirectories) {
-    try {
-      const pageFiles = await glob('**/*.{js,jsx,ts,tsx,vue}', {
-        cwd: pagesDir,
-        absolute: true,
-        ignore: ['**/node_modules/**', '**/*.test.*', '**/*.spec.*']
-      });
-
-      // Read up to 3 page files for context (reduced from 5 to manage size)
-      const limitedFiles = pageFiles.slice(0, 3);
-
-      for (const file of limitedFiles) {
-        if (currentPagesSize >= maxTotalPagesSize) {
-          break; // Stop if we've hit our size limit
-        }
-
-        try {
-          let content = await readFile(file, 'utf-8');
-          const relativePath = path.relative(projectDir, file);
-
-          // Truncate individual file content if needed
-          const maxFileSize = 1000; // Max size per file
-          if (content.length > maxFileSize) {
-            content = content.substring(0, maxFileSize) + '...[truncated]';
-          }
-
-          const fileEntry = `File: ${relativePath}\n${content}\n\n`;
-
-          // Check if adding this file would exceed our total limit
-          if (currentPagesSize + fileEntry.length <= maxTotalPagesSize) {
-            context.pages.push(fileEntry);
-            currentPagesSize += fileEntry.length;
-          } else {
-            // Add what we can of this file
-            const remainingSpace = maxTotalPagesSize - currentPagesSize;
-            if (remainingSpace > 100) { // Only add if we have meaningful space left
-              const truncatedEntry = fileEntry.substring(0, remainingSpace) + '...[truncated]';
-              context.pages.push(truncatedEntry);
-            }
-            break;
-          }
-        } catch (error) {
-          // Skip files that can't be read
-        }
-      }
-    } catch (error) {
-      // Skip directories that can't be read
-    }
-  }
-
-
-
   return context;
 }
 
@@ -1415,8 +1367,9 @@ async function analyzeProject(projectDir: string): Promise<ProjectAnalysis> {
  */
 async function applyLinkTextFixes(projectDir: string): Promise<{ totalFixes: number; filesModified: number }> {
   try {
-    const { getAuthToken } = await import('../utils/config.js');
-    const token = await getAuthToken();
+    const { getAuthTokens } = await import('../utils/config.js');
+    const tokens = await getAuthTokens();
+    const token = tokens?.idToken;
 
     if (!token) {
       return null;
@@ -1440,38 +1393,27 @@ async function applyLinkTextFixes(projectDir: string): Promise<{ totalFixes: num
     let totalFixesApplied = 0;
     let filesModified = 0;
 
-    // Process files in smaller batches to avoid overwhelming the API
-    const batchSize = 3;
-    for (let i = 0; i < linkFiles.length; i += batchSize) {
-      const batch = linkFiles.slice(i, i + batchSize);
-
-      const batchPromises = batch.map(async (file) => {
-        try {
-          const fixesApplied = await fixLinksInFile(file, token);
-          if (fixesApplied > 0) {
-            return { file, fixes: fixesApplied };
-          }
-          return null;
-        } catch (error) {
-          if (false) {
-            console.warn(chalk.yellow(`Failed to fix links in ${file}: ${error}`));
-          }
-          return null;
+    // Keep a small, fixed number of requests in flight to avoid overwhelming the API
+    const maxConcurrentRequests = 3;
+    const results = await mapWithConcurrency(linkFiles, maxConcurrentRequests, async (file) => {
+      try {
+        const fixesApplied = await fixLinksInFile(file, token, tokens.email);
+        if (fixesApplied > 0) {
+          return { file, fixes: fixesApplied };
         }
-      });
-
-      const batchResults = await Promise.all(batchPromises);
-
-      for (const result of batchResults) {
-        if (result) {
-          totalFixesApplied += result.fixes;
-          filesModified++;
+        return null;
+      } catch (error) {
+        if (false) {
+          console.warn(chalk.yellow(`Failed to fix links in ${file}: ${error}`));
         }
+        return null;
       }
+    });
 
-      // Small delay between batches to be respectful to the API
-      if (i + batchSize < linkFiles.length) {
-        await new Promise(resolve => setTimeout(resolve, 500));
+    for (const result of results) {
+      if (result) {
+        totalFixesApplied += result.fixes;
+        filesModified++;
       }
     }
 
@@ -1492,7 +1434,7 @@ async function applyLinkTextFixes(projectDir: string): Promise<{ totalFixes: num
 /**
  * Fix non-descriptive links in a single file using AI analysis
  */
-async function fixLinksInFile(filePath: string, authToken: string): Promise<number> {
+async function fixLinksInFile(filePath: string, authToken: string, account: string): Promise<number> {
   const fs = await import('fs');
 
   try {
@@ -1507,21 +1449,26 @@ async function fixLinksInFile(filePath: string, authToken: string): Promise<numb
       return 0;
     }
 
-    // Make request to backend for link analysis
-    const response = await axios.post('https://a8iza6csua.execute-api.us-east-2.amazonaws.com/ask-openai', {
-      prompt: `Analyze and fix non-descriptive link text in this file:\n\nFile: ${filePath}`,
-      context: 'seo-analysis',
-      file_content: originalContent,
-      file_path: filePath
-    }, {
-      headers: {
-        'Authorization': `Bearer ${authToken}`,
-        'Content-Type': 'application/json',
-      },
-      timeout: 30000
-    });
+    // Make request to backend for link analysis, unless this exact file was analyzed recently
+    const linkCacheKey = cacheKey('seo-analysis', account, filePath, originalContent);
+    let responseData = await getCached<any>(linkCacheKey);
+    if (!responseData) {
+      const response = await httpClient.post('/ask-openai', {
+        prompt: `Analyze and fix non-descriptive link text in this file:\n\nFile: ${filePath}`,
+        context: 'seo-analysis',
+        file_content: originalContent,
+        file_path: filePath
+      }, {
+        headers: {
+          'Authorization': `Bearer ${authToken}`,
+          'Content-Type': 'application/json',
+        },
+        timeout: 30000
+      });
+      responseData = response.data;
+      await setCached(linkCacheKey, responseData);
+    }
 
-    const responseData = response.data;
     let fixesApplied = 0;
     let modifiedContent = originalContent;
 
@@ -1593,6 +1540,28 @@ async function fixLinksInFile(filePath: string, authToken: string): Promise<numb
   }
 }
 
+// Link texts that never describe their destination
+const GENERIC_LINK_TEXTS = new Set(['here', 'click here', 'read more', 'learn more', 'more', 'this', 'link']);
+
+// Replacement link text by href path segment, in priority order (first match wins)
+const LINK_TEXT_BY_PATH: Array<[RegExp, string]> = [
+  [/\/about/, 'about us'],
+  [/\/contact/, 'contact us'],
+  [/\/pricing/, 'view pricing'],
+  [/\/docs|\/documentation/, 'documentation'],
+  [/\/blog/, 'blog'],
+  [/\/support/, 'support'],
+  [/\/help/, 'help center'],
+  [/\/signup|\/register/, 'sign up'],
+  [/\/login|\/signin/, 'sign in'],
+  [/\/download/, 'download'],
+  [/\/features/, 'features'],
+  [/\/api/, 'API documentation'],
+  [/\/rate-limits/, 'rate limits documentation'],
+  [/\/terms/, 'terms of service'],
+  [/\/privacy/, 'privacy policy'],
+];
+
 /**
  * Generate better link text based on href and current text
  */
@@ -1600,26 +1569,13 @@ function generateBetterLinkText(currentText: string, href: string): string {
   const text = currentText.toLowerCase().trim();
 
   // Don't change if it's already reasonably descriptive
-  if (text.length > 10 && !['here', 'click here', 'read more', 'learn more', 'more', 'this', 'link'].includes(text)) {
+  if (text.length > 10 && !GENERIC_LINK_TEXTS.has(text)) {
     return currentText;
   }
 
   // Generate better text based on href
-  if (href.includes('/about')) return 'about us';
-  if (href.includes('/contact')) return 'contact us';
-  if (href.includes('/pricing')) return 'view pricing';
-  if (href.includes('/docs') || href.includes('/documentation')) return 'documentation';
-  if (href.includes('/blog')) return 'blog';
-  if (href.includes('/support')) return 'support';
-  if (href.includes('/help')) return 'help center';
-  if (href.includes('/signup') || href.includes('/register')) return 'sign up';
-  if (href.includes('/login') || href.includes('/signin')) return 'sign in';
-  if (href.includes('/download')) return 'download';
-  if (href.includes('/features')) return 'features';
-  if (href.includes('/api')) return 'API documentation';
-  if (href.includes('/rate-limits')) return 'rate limits documentation';
-  if (href.includes('/terms')) return 'terms of service';
-  if (href.includes('/privacy')) return 'privacy policy';
+  const entry = LINK_TEXT_BY_PATH.find(([pattern]) => pattern.test(href));
+  if (entry) return entry[1];
 
   // Extract meaningful parts from path
   const pathParts = href.split('/').filter(part => part && !part.includes('.'));
@@ -2,17 +2,17 @@ import { glob } from 'glob';
 import * as cheerio from 'cheerio';
 import chalk from 'chalk';
 import ora from 'ora';
-import { readFile } from 'fs/promises';
+import { readFile, access } from 'fs/promises';
 import { join, dirname, resolve } from 'path';
 import path from 'path';
 import { readFileSync, existsSync } from 'fs';
 
 import { loadConfig } from '../utils/config.js';
+import { memoizeByProjectRoot } from '../utils/detect-framework.js';
 import { ScanOptions, SeoIssue, ScanResult } from '../types/index.js';
 import fs from 'fs';
 // import { authCommand } from './auth.js'; // Removed - no longer needed
 // import { file } from '@babel/types'; // Removed - unused import
-// import { detectFramework, findProjectRoot } from '../utils/detect-framework.js';
 // import { scanReactComponent } from '../frameworks/react.js';
 import axios from 'axios';
 
@@ -34,11 +34,14 @@ function findProjectRoot(startDir = process.cwd()): string {
   return process.cwd(); // fallback
 }
 
+// Framework is a property of the whole project, so each root is only scanned once per run
+const detectFramework = memoizeByProjectRoot(detectFrameworkUncached);
+
 /**
  * Scans all package.json files in the project for framework dependencies.
  * Returns the first framework found, or 'unknown' if none found.
  */
-async function detectFramework(projectRoot: string): Promise<'react' | 'vue' | 'next.js' | 'unknown'> {
+async function detectFrameworkUncached(projectRoot: string): Promise<'react' | 'vue' | 'next.js' | 'unknown'> {
   // Find all package.json files, excluding node_modules and common build/test dirs
   const packageJsonFiles = await glob('**/package.json', {
     cwd: projectRoot,
@@ -90,40 +93,25 @@ async function checkRequiredSeoFiles(): Promise<SeoIssue[]> {
     { robots: join(root, 'public', 'robots.txt'), sitemap: join(root, 'public', 'sitemap.xml'), llms: join(root, 'public', 'llms.txt') }
   ];
 
-  let robotsFound = false;
-  let sitemapFound = false;
-  let llmsFound = false;
-
-  // Check all possible locations
-  for (const paths of possiblePaths) {
-    try {
-      await readFile(paths.robots, 'utf-8');
-      robotsFound = true;
-      break;
-    } catch {
-      // Continue checking other locations
-    }
-  }
-
-  for (const paths of possiblePaths) {
-    try {
-      await readFile(paths.sitemap, 'utf-8');
-      sitemapFound = true;
-      break;
-    } catch {
-      // Continue checking other locations
-    }
-  }
+  // A file counts as found if it exists in any of the candidate locations
+  const existsInAny = async (candidates: string[]): Promise<boolean> => {
+    const checks = await Promise.all(candidates.map(async (candidate) => {
+      try {
+        await access(candidate);
+        return true;
+      } catch {
+        return false;
+      }
+    }));
+    return checks.some(Boolean);
+  };
 
-  for (const paths of possiblePaths) {
-    try {
-      await readFile(paths.llms, 'utf-8');
-      llmsFound = true;
-      break;
-    } catch {
-      // Continue checking other locations
-    }
-  }
+  // Check all possible locations concurrently
+  const [robotsFound, sitemapFound, llmsFound] = await Promise.all([
+    existsInAny(possiblePaths.map(paths => paths.robots)),
+    existsInAny(possiblePaths.map(paths => paths.sitemap)),
+    existsInAny(possiblePaths.map(paths => paths.llms)),
+  ]);
 
   if (!robotsFound) {
     issues.push({
@@ -168,7 +156,7 @@ const basicSeoRules = {
   },
   missingRobotsTxt: async (projectRoot: string) => {
     try {
-      await readFile(join(projectRoot, 'robots.txt'));
+      await access(join(projectRoot, 'robots.txt'));
       return false;
     } catch {
       return true;
@@ -176,7 +164,7 @@ const basicSeoRules = {
   },
   missingLlmsTxt: async (projectRoot: string) => {
     try {
-      await readFile(join(projectRoot, 'llms.txt'));
+      await access(join(projectRoot, 'llms.txt'));
       return false;
     } catch {
       return true;
@@ -184,6 +172,28 @@ const basicSeoRules = {
   },
 };
 
+// Imports/hooks that indicate a component already manages its meta tags
+const META_MANAGER_RE = /import \{ ?(?:Helmet|Head) ?\}|next\/head|useHead|useSeoMeta/;
+const PARENT_HELMET_RE = /import \{ Helmet \}|<Helmet>/;
+
+// JSX/template patterns shared by the component scanners
+const IMG_TAG_RE = /<img[^>]*?>/g;
+const ALT_ATTR_RE = /alt=["'][^"']*["']|alt=\{[^}]+\}/;
+const LINK_TAG_RE = /<(?:Link|a)[^>]*>([^<]*)<\/(?:Link|a)>/g;
+const IMG_LINK_RE = /<(?:Link|a)[^>]*>\s*<img[^>]*?>\s*<\/(?:Link|a)>/g;
+const DIV_RE = /<div[^>]*>.*?<\/div>/g;
+const NAV_TEXT_RE = /nav/i;
+const NAV_TAG_RE = /<nav/i;
+const MAIN_CONTENT_TEXT_RE = /main content|content main/i;
+const MAIN_TAG_RE = /<main/i;
+const H1_TAG_RE = /<h1[^>]*>/g;
+const VUE_TEMPLATE_RE = /<template>([\s\S]*?)<\/template>/;
+const VUE_META_IMPORT_RE = /['"]vue-meta['"]/;
+const VUE_META_USAGE_RE = /metaInfo\s*\(|\bmeta\s*:\s*\[/;
+
+// pages/views/screens/routes directories, or the root App component
+const PAGE_PATH_RE = /\/(?:pages|views|screens|routes)\/|^src\/App\.tsx$/;
+
 /**
  * Checks if a file is a page component that needs meta tag management
  * 
@@ -201,26 +211,18 @@ function isPageComponent(filePath: string): boolean {
     return false;
   }
 
-  const pagePatterns = [
-    /\/pages\//,           // pages directory
-    /\/views\//,           // views directory
-    /\/screens\//,         // screens directory
-    /\/routes\//,          // routes directory
-    /^src\/App\.tsx$/,    // App component
-  ];
-  
-  return pagePatterns.some(pattern => pattern.test(filePath));
+  return PAGE_PATH_RE.test(filePath);
 }
 
 /**
  * Checks file for missing schema.org markup
  * 
  * @param filePath - Path to file to scan
+ * @param content - Contents of the file, already read by the caller
  * @returns List of SEO issues found.
  */
-async function checkSchemaMarkup(filePath: string): Promise<SeoIssue[]> {
+function checkSchemaMarkup(filePath: string, content: string): SeoIssue[] {
   const issues: SeoIssue[] = [];
-  const content = await readFile(filePath, 'utf-8');
 
   // Only check page components
   if (!isPageComponent(filePath)) {
@@ -233,15 +235,14 @@ async function checkSchemaMarkup(filePath: string): Promise<SeoIssue[]> {
 
   if (!hasSchemaScript && !hasSchemaProps) {
     // Determine page type from file path/name
-    const fileName = filePath.toLowerCase();
-    if (fileName.includes('blog') || fileName.includes('article')) {
+    if (/blog|article/i.test(filePath)) {
       issues.push({
         type: 'warning',
         message: 'Missing Article schema markup',
         file: filePath,
         fix: 'Add Article schema.org markup for better search results',
       });
-    } else if (fileName.includes('product')) {
+    } else if (/product/i.test(filePath)) {
       issues.push({
         type: 'warning',
         message: 'Missing Product schema markup',
@@ -276,18 +277,12 @@ async function scanReactComponent(filePath: string): Promise<SeoIssue[]> {
   const content = await readFile(filePath, 'utf-8');
   
   // Check if file uses React Helmet or similar
-  const hasHelmet = content.includes('import { Helmet }') || 
-                   content.includes("import {Helmet}") ||
-                   content.includes('import {Head}') ||
-                   content.includes('import { Head }') ||
-                   content.includes('next/head') ||
-                   content.includes('useHead') ||
-                   content.includes('useSeoMeta');
+  const hasHelmet = META_MANAGER_RE.test(content);
   
   if (!hasHelmet && isPageComponent(filePath)) {
     // Check if the file might be using Helmet from a parent component
     const appContent = await readFile(join(dirname(filePath), '../App.tsx'), 'utf-8').catch(() => '');
-    const hasParentHelmet = appContent.includes('import { Helmet }') || appContent.includes('<Helmet>');
+    const hasParentHelmet = PARENT_HELMET_RE.test(appContent);
     
     if (!hasParentHelmet) {
       issues.push({
@@ -300,13 +295,9 @@ async function scanReactComponent(filePath: string): Promise<SeoIssue[]> {
   }
 
   // Check for img tags without alt using regex that accounts for JSX
-  const imgTagRegex = /<img[^>]*?>/g;
-  const altRegex = /alt=["'][^"']*["']|alt=\{[^}]+\}/;
-  
-  let match;
-  while ((match = imgTagRegex.exec(content)) !== null) {
+  for (const match of content.matchAll(IMG_TAG_RE)) {
     const imgTag = match[0];
-    if (!altRegex.test(imgTag)) {
+    if (!ALT_ATTR_RE.test(imgTag)) {
       issues.push({
         type: 'warning',
         message: 'Image missing alt text',
@@ -317,8 +308,7 @@ async function scanReactComponent(filePath: string): Promise<SeoIssue[]> {
     }
   }
 
-  const linkRegex = /<(?:Link|a)[^>]*>([^<]*)<\/(?:Link|a)>/g;
-  while ((match = linkRegex.exec(content)) !== null) {
+  for (const match of content.matchAll(LINK_TAG_RE)) {
     const linkTag = match[0];
     const linkText = match[1].trim();
 
@@ -335,10 +325,9 @@ async function scanReactComponent(filePath: string): Promise<SeoIssue[]> {
   }
 
   // Check for links that only contain images without alt text
-  const imgLinkRegex = /<(?:Link|a)[^>]*>\s*<img[^>]*?>\s*<\/(?:Link|a)>/g;
-  while ((match = imgLinkRegex.exec(content)) !== null) {
+  for (const match of content.matchAll(IMG_LINK_RE)) {
     const linkTag = match[0];
-    if (!altRegex.test(linkTag)) {
+    if (!ALT_ATTR_RE.test(linkTag)) {
       issues.push({
         type: 'warning',
         message: 'Link contains image without alt text',
@@ -350,10 +339,9 @@ async function scanReactComponent(filePath: string): Promise<SeoIssue[]> {
   }
 
   // Check for semantic HTML issues
-  const divRegex = /<div[^>]*>.*?<\/div>/g;
-  while ((match = divRegex.exec(content)) !== null) {
-    const divContent = match[0].toLowerCase();
-    if (divContent.includes('nav') && !divContent.includes('<nav')) {
+  for (const match of content.matchAll(DIV_RE)) {
+    const divContent = match[0];
+    if (NAV_TEXT_RE.test(divContent) && !NAV_TAG_RE.test(divContent)) {
       issues.push({
         type: 'warning',
         message: 'Navigation not using semantic <nav> element',
@@ -362,7 +350,7 @@ async function scanReactComponent(filePath: string): Promise<SeoIssue[]> {
         fix: 'Replace div with semantic <nav> element for better SEO',
       });
     }
-    if ((divContent.includes('main content') || divContent.includes('content main')) && !divContent.includes('<main')) {
+    if (MAIN_CONTENT_TEXT_RE.test(divContent) && !MAIN_TAG_RE.test(divContent)) {
       issues.push({
         type: 'warning',
         message: 'Main content not using semantic <main> element',
@@ -374,12 +362,11 @@ async function scanReactComponent(filePath: string): Promise<SeoIssue[]> {
   }
 
   // Check for schema markup
-  const schemaIssues = await checkSchemaMarkup(filePath);
+  const schemaIssues = checkSchemaMarkup(filePath, content);
   issues.push(...schemaIssues);
 
   // Check for H1 tag issues in React components
-  const h1Regex = /<h1[^>]*>/g;
-  const h1Matches = content.match(h1Regex) || [];
+  const h1Matches = content.match(H1_TAG_RE) || [];
   if (h1Matches.length === 0) {
     issues.push({
       type: 'warning',
@@ -431,7 +418,7 @@ async function scanVueComponent(filePath: string): Promise<SeoIssue[]> {
   //entry point files
   
   if (filePath.endsWith('main.tsx') || filePath.endsWith('main.js')) {
-    const usesVueMeta = /['"]vue-meta['"]/.test(content) || content.includes('createMetaManager');
+    const usesVueMeta = VUE_META_IMPORT_RE.test(content) || content.includes('createMetaManager');
 
       if (!usesVueMeta) {
         issues.push({
@@ -446,7 +433,7 @@ async function scanVueComponent(filePath: string): Promise<SeoIssue[]> {
  
   
   // Check if file uses Vue-meta or similar
-  const hasMeta = /metaInfo\s*\(|\bmeta\s*:\s*\[/.test(content);
+  const hasMeta = VUE_META_USAGE_RE.test(content);
   
   if (!hasMeta && isPageComponent(filePath)) {
       issues.push({
@@ -459,11 +446,10 @@ async function scanVueComponent(filePath: string): Promise<SeoIssue[]> {
   }
 
   // Check for H1 tag issues in Vue templates
-  const templateMatch = content.match(/<template>([\s\S]*?)<\/template>/);
+  const templateMatch = content.match(VUE_TEMPLATE_RE);
   if (templateMatch) {
     const templateContent = templateMatch[1];
-    const h1Regex = /<h1[^>]*>/g;
-    const h1Matches = templateContent.match(h1Regex) || [];
+    const h1Matches = templateContent.match(H1_TAG_RE) || [];
     
     if (h1Matches.length === 0) {
       issues.push({
@@ -483,7 +469,7 @@ async function scanVueComponent(filePath: string): Promise<SeoIssue[]> {
   }
 
   // Check for schema markup
-  const schemaIssues = await checkSchemaMarkup(filePath);
+  const schemaIssues = checkSchemaMarkup(filePath, content);
   issues.push(...schemaIssues);
 
   return issues;
@@ -497,10 +483,10 @@ async function scanVueComponent(filePath: string): Promise<SeoIssue[]> {
  */
 async function scanNextComponent(filePath: string): Promise<SeoIssue[]> {
   const issues: SeoIssue[] = [];
-  const content = await readFile(filePath, 'utf-8');
-
   if(!isPageComponent(filePath)) return issues;
 
+  const content = await readFile(filePath, 'utf-8');
+
   // Check for critical "use client" + metadata issue
   const hasUseClient = content.includes('"use client"') || content.includes("'use client'");
   const hasMetadataExport = content.includes('export const metadata');
@@ -545,8 +531,7 @@ async function scanNextComponent(filePath: string): Promise<SeoIssue[]> {
   }
 
   // Check for H1 tag issues in Next.js components
-  const h1Regex = /<h1[^>]*>/g;
-  const h1Matches = content.match(h1Regex) || [];
+  const h1Matches = content.match(H1_TAG_RE) || [];
   if (h1Matches.length === 0) {
     issues.push({
       type: 'warning',
@@ -575,16 +560,17 @@ async function scanNextComponent(filePath: string): Promise<SeoIssue[]> {
  * @returns List of SEO issues found
  */
 async function performBasicScan(filePath: string): Promise<SeoIssue[]> {
+  // Only HTML files get the basic scan, so bail out before touching the project
+  if (!filePath.endsWith('.html')) return [];
 
   const framework = await detectFramework(findProjectRoot());
   // Skip HTML files for popular frameworks (we assume they handle SEO through components)
   if (framework != 'unknown') return [];
 
-  if (!filePath.endsWith('.html')) return [];
-
   const issues: SeoIssue[] = [];
   const content = await readFile(filePath, 'utf-8');
-  const $ = cheerio.load(content);
+  // Scan is read-only, so use htmlparser2 instead of the default parse5 tree builder
+  const $ = cheerio.load(content, { xml: { xmlMode: false } });
 
   // Check basic SEO rules
   if (basicSeoRules.missingTitle($)) {
@@ -691,10 +677,17 @@ export async function scanCommand(options: ScanOptions) {
         '**/__tests__/**',
         '**/__mocks__/**',
         '**/vendor/**',
-        '**/public/**'
+        '**/public/**',
+        // Type declarations, minified bundles and tool caches never contain page markup
+        '**/*.d.ts',
+        '**/*.min.js',
+        '**/.cache/**',
+        '**/.vite/**',
+        '**/.turbo/**'
       ],
       absolute: true,
-      dot: true
+      dot: true,
+      nodir: true
     });
 
     if (files.length === 0) {
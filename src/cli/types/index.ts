@@ -31,7 +31,7 @@ export interface Config {
   openaiApiKey?: string;
   githubToken?: string;
   googleApiKey?: string;
-  auth0Tokens?: string; // JSON string containing Auth0 tokens
+  auth0Tokens?: AuthTokens | string; // Auth0 tokens (older configs stored them as a JSON string)
   userEmail?: string;
   aiAccess?: boolean;
   aiModel?: string;
@@ -52,6 +52,14 @@ export interface GitPrOptions {
 }
 
 // Authentication Types
+export interface AuthTokens {
+  idToken: string;
+  accessToken: string;
+  email: string;
+  aiAccess: boolean;
+  expiresAt: number;
+}
+
 export interface AuthenticationResult {
   success: boolean;
   token?: string;
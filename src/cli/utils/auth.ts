@@ -5,6 +5,8 @@ import chalk from 'chalk';
 import ora from 'ora';
 import axios from 'axios';
 import { setAuthTokens, clearAuthTokens, getAuthTokens } from './config.js';
+import { clearCache } from './cache.js';
+import { httpClient } from './http.js';
 import { AuthenticationResult } from '../types/index.js';
 import { createHash, randomBytes } from 'crypto';
 
@@ -12,7 +14,6 @@ import { createHash, randomBytes } from 'crypto';
 const AUTH0_DOMAIN = 'auth.cliseo.com'
 const CLIENT_ID = 'kCZh9ll7L7RItLWLc47aOmDbffjQTmNd'
 const REDIRECT_URI = 'http://localhost:8080/callback'
-const API_BASE = process.env.API_URL || process.env.CLISEO_API_URL || 'https://a8iza6csua.execute-api.us-east-2.amazonaws.com'
 
 interface AuthCallbackData {
   code?: string;
@@ -168,7 +169,7 @@ function createAuthServer(): Promise<{ server: Server; port: number; authPromise
  */
 async function exchangeCodeForTokens(code: string, codeVerifier: string): Promise<{ access_token: string; id_token: string }> {
   try {
-    const response = await axios.post(`https://${AUTH0_DOMAIN}/oauth/token`, {
+    const response = await httpClient.post(`https://${AUTH0_DOMAIN}/oauth/token`, {
       grant_type: 'authorization_code',
       client_id: CLIENT_ID,
       code,
@@ -197,8 +198,7 @@ async function exchangeCodeForTokens(code: string, codeVerifier: string): Promis
  */
 async function verifyAuth0Token(auth0Token: string): Promise<{ email: string; aiAccess: boolean }> {
   try {
-    if (!API_BASE) throw new Error('Missing API base URL. Set API_URL or CLISEO_API_URL.');
-    const response = await axios.post(`${API_BASE}/auth/sync`, {}, {
+    const response = await httpClient.post('/auth/sync', {}, {
       headers: {
         'Authorization': `Bearer ${auth0Token}`,
         'Content-Type': 'application/json',
@@ -343,8 +343,7 @@ export async function verifyAuthentication(): Promise<boolean> {
     }
 
   // Verify token with Auth0 by making a test API call
-  if (!API_BASE) return false;
-  const response = await axios.post(`${API_BASE}/auth/sync`, {}, {
+  const response = await httpClient.post('/auth/sync', {}, {
       headers: {
         'Authorization': `Bearer ${authData.idToken}`,
         'Content-Type': 'application/json',
@@ -358,8 +357,9 @@ export async function verifyAuthentication(): Promise<boolean> {
 }
 
 /**
- * Logout user by clearing stored tokens
+ * Logout user by clearing stored tokens and any cached AI responses
  */
 export async function logoutUser(): Promise<void> {
   await clearAuthTokens();
+  await clearCache();
 } 
\ No newline at end of file
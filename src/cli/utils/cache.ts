@@ -0,0 +1,61 @@
+import { readFile, writeFile, mkdir, unlink, rm } from 'fs/promises';
+import { join } from 'path';
+import { homedir } from 'os';
+import { createHash } from 'crypto';
+
+const CACHE_DIR = join(homedir(), '.cliseo', 'cache');
+const DEFAULT_TTL_MS = 24 * 60 * 60 * 1000; // 1 day
+
+interface CacheEntry<T> {
+  expiresAt: number;
+  value: T;
+}
+
+/**
+ * Builds a stable cache key from any JSON-serializable inputs.
+ */
+export function cacheKey(...parts: unknown[]): string {
+  return createHash('sha256').update(JSON.stringify(parts)).digest('hex');
+}
+
+/**
+ * Returns the cached value for a key, or undefined if it is missing, expired,
+ * or caching is disabled with CLISEO_NO_CACHE=true.
+ */
+export async function getCached<T>(key: string): Promise<T | undefined> {
+  if (process.env.CLISEO_NO_CACHE === 'true') return undefined;
+
+  try {
+    const entryPath = join(CACHE_DIR, `${key}.json`);
+    const entry: CacheEntry<T> = JSON.parse(await readFile(entryPath, 'utf-8'));
+    if (Date.now() > entry.expiresAt) {
+      await unlink(entryPath).catch(() => {});
+      return undefined;
+    }
+    return entry.value;
+  } catch {
+    return undefined;
+  }
+}
+
+/**
+ * Stores a value on disk under the given key.
+ */
+export async function setCached<T>(key: string, value: T, ttlMs = DEFAULT_TTL_MS): Promise<void> {
+  if (process.env.CLISEO_NO_CACHE === 'true') return;
+
+  try {
+    await mkdir(CACHE_DIR, { recursive: true });
+    const entry: CacheEntry<T> = { expiresAt: Date.now() + ttlMs, value };
+    await writeFile(join(CACHE_DIR, `${key}.json`), JSON.stringify(entry));
+  } catch {
+    // Caching is best-effort; a failed write just means the next run asks the API again
+  }
+}
+
+/**
+ * Removes every cached entry.
+ */
+export async function clearCache(): Promise<void> {
+  await rm(CACHE_DIR, { recursive: true, force: true }).catch(() => {});
+}
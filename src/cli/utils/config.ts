@@ -1,7 +1,7 @@
 import { readFile, writeFile } from 'fs/promises';
 import { join } from 'path';
 import { homedir } from 'os';
-import { Config } from '../types/index.js';
+import { AuthTokens, Config } from '../types/index.js';
 
 const CONFIG_FILE = '.cliseorc.json';
 const GLOBAL_CONFIG_FILE = join(homedir(), '.cliseorc');
@@ -67,18 +67,15 @@ export async function setApiKey(key: 'openaiApiKey' | 'githubToken' | 'googleApi
 }
 
 // Authentication utilities for Auth0 tokens
-interface AuthTokens {
-  idToken: string;
-  accessToken: string;
-  email: string;
-  aiAccess: boolean;
-  expiresAt: number;
-}
-
 export async function getAuthTokens(): Promise<AuthTokens | undefined> {
   const config = await loadConfig();
   if (!config.auth0Tokens) return undefined;
-  
+
+  // Tokens are stored as a plain object; only older configs need a second parse
+  if (typeof config.auth0Tokens !== 'string') {
+    return config.auth0Tokens;
+  }
+
   try {
     return JSON.parse(config.auth0Tokens);
   } catch {
@@ -88,7 +85,7 @@ export async function getAuthTokens(): Promise<AuthTokens | undefined> {
 
 export async function setAuthTokens(tokens: AuthTokens): Promise<void> {
   await updateConfig({ 
-    auth0Tokens: JSON.stringify(tokens),
+    auth0Tokens: tokens,
     userEmail: tokens.email,
     aiAccess: tokens.aiAccess
   }, true); // Always save auth tokens in global config
@@ -0,0 +1,20 @@
+import { resolve } from 'path';
+
+/**
+ * Wraps a framework detector so each project root is only scanned once per run.
+ * Roots are compared by absolute path, and failed detections are not cached.
+ */
+export function memoizeByProjectRoot<F>(detect: (projectRoot: string) => Promise<F>): (projectRoot: string) => Promise<F> {
+  const cache = new Map<string, Promise<F>>();
+
+  return (projectRoot: string) => {
+    const key = resolve(projectRoot);
+    let framework = cache.get(key);
+    if (!framework) {
+      framework = detect(key);
+      cache.set(key, framework);
+      framework.catch(() => cache.delete(key));
+    }
+    return framework;
+  };
+}
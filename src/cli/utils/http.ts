@@ -0,0 +1,31 @@
+import axios from 'axios';
+import { Agent as HttpAgent } from 'http';
+import { Agent as HttpsAgent } from 'https';
+import { readFileSync } from 'fs';
+import { fileURLToPath } from 'url';
+import { dirname, join } from 'path';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const packageJson = JSON.parse(
+  readFileSync(join(__dirname, '../../../package.json'), 'utf8')
+);
+
+// cliseo backend; override with API_URL or CLISEO_API_URL
+export const API_BASE = process.env.API_URL || process.env.CLISEO_API_URL || 'https://a8iza6csua.execute-api.us-east-2.amazonaws.com';
+
+// Keep-alive agents so repeated calls to the same host reuse TCP/TLS connections
+const agentOptions = { keepAlive: true, maxSockets: 20, maxFreeSockets: 10 };
+
+/**
+ * Shared axios instance for all outgoing requests made by the CLI.
+ * Relative paths resolve against the cliseo backend; absolute URLs are used as-is.
+ */
+export const httpClient = axios.create({
+  baseURL: API_BASE,
+  httpAgent: new HttpAgent(agentOptions),
+  httpsAgent: new HttpsAgent(agentOptions),
+  headers: {
+    'User-Agent': `cliseo/${packageJson.version}`,
+  },
+});